@@ -14,11 +14,317 @@ import json
 import logging
 import argparse
 import os
-from datetime import datetime
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
+import shutil
+import sys
+import concurrent.futures
+import functools
+from email.message import EmailMessage
 from typing import Dict, List, Optional
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader
+
+try:
+    import liburing
+except ImportError:  # Optional - io_uring batched reads (Linux only)
+    liburing = None
+
+try:
+    import orjson
+except ImportError:  # Optional - faster JSON output
+    orjson = None
+
+_GB = 1 << 30
+
+# Shortest interval, in seconds, the first CPU sample is measured over
+_MIN_CPU_WINDOW = 1.0
+
+
+@functools.lru_cache(maxsize=1)
+def _fast_ts(epoch: int) -> str:
+    """
+    Format an epoch second as local 'YYYY-MM-DD HH:MM:SS'.
+
+    Callers within the same second share one cached result.
+    """
+    tm = time.localtime(epoch)
+    return (f"{tm.tm_year}-{tm.tm_mon:02d}-{tm.tm_mday:02d} "
+            f"{tm.tm_hour:02d}:{tm.tm_min:02d}:{tm.tm_sec:02d}")
+
+
+def _count_pids() -> int:
+    """
+    Count running processes without building a list of PIDs.
+
+    On Linux this scans /proc directly; elsewhere it falls back to psutil.
+
+    Returns:
+        int: Number of running processes
+    """
+    try:
+        count = 0
+        with os.scandir('/proc') as it:
+            for entry in it:
+                if entry.name[0].isdigit():
+                    count += 1
+        return count
+    except OSError:
+        return len(psutil.pids())
+
+
+def _load_avg() -> float:
+    """Return the 1-minute load average, or 0 where it is unsupported."""
+    # Load Average (Unix-like systems)
+    try:
+        return psutil.getloadavg()[0] if hasattr(psutil, 'getloadavg') else 0
+    except (OSError, AttributeError):
+        return 0
+
+
+def _parse_proc_stat(data: bytes) -> tuple:
+    """Return (total, idle) CPU jiffies from the first line of /proc/stat."""
+    fields = [int(x) for x in data[:data.index(b'\n')].split()[1:]]
+    # guest/guest_nice are already accounted for in user/nice
+    total = sum(fields[:8])
+    idle = fields[3] + fields[4]
+    return total, idle
+
+
+def _parse_proc_meminfo(data: bytes) -> Dict:
+    """Return memory figures in bytes, computed like psutil 5.9's virtual_memory()."""
+    info = {}
+    for line in data.splitlines():
+        key, _, rest = line.partition(b':')
+        info[key] = int(rest.split()[0]) * 1024
+    total = info[b'MemTotal']
+    free = info[b'MemFree']
+    available = info.get(b'MemAvailable', free)
+    cached = info.get(b'Cached', 0) + info.get(b'SReclaimable', 0)
+    used = total - free - cached - info.get(b'Buffers', 0)
+    if used < 0:
+        used = total - free
+    return {
+        'mem_total': total,
+        'mem_used': used,
+        'mem_available': available,
+        'mem_percent': round((total - available) / total * 100, 1),
+    }
+
+
+def _parse_proc_net_dev(data: bytes) -> Dict:
+    """Return network counters summed over all interfaces."""
+    bytes_recv = packets_recv = bytes_sent = packets_sent = 0
+    for line in data.splitlines()[2:]:
+        fields = line.partition(b':')[2].split()
+        bytes_recv += int(fields[0])
+        packets_recv += int(fields[1])
+        bytes_sent += int(fields[8])
+        packets_sent += int(fields[9])
+    return {
+        'bytes_sent': bytes_sent,
+        'bytes_recv': bytes_recv,
+        'packets_sent': packets_sent,
+        'packets_recv': packets_recv,
+    }
+
+
+_ALERT_HEADER = """
+System Health Alert - Threshold Exceeded
+
+Time: {timestamp}
+System Uptime: {uptime_days} days, {uptime_hours} hours
+
+ALERTS:"""
+
+_ALERT_FOOTER = """
+
+CURRENT SYSTEM STATUS:
+  CPU Usage: {cpu[percent]:.1f}% (Load: {cpu[load_avg]})
+  Memory Usage: {memory[percent]:.1f}% ({memory[used_gb]:.1f}GB / {memory[total_gb]:.1f}GB)
+  Disk Usage: {disk[percent]:.1f}% ({disk[used_gb]:.1f}GB / {disk[total_gb]:.1f}GB)
+  Active Processes: {system[process_count]}
+
+Please investigate and take necessary action.
+
+---
+System Health Monitor
+Generated automatically
+"""
+
+
+def _pread_grow(fd: int, size: int) -> bytes:
+    """
+    Read a whole file from offset 0, doubling the buffer until it fits.
+
+    Used when a fixed-size read filled its buffer and may have cut the
+    file off.
+    """
+    while True:
+        size *= 2
+        buf = bytearray(size)
+        n = os.preadv(fd, [buf], 0)
+        if n < size:
+            return bytes(memoryview(buf)[:n])
+
+
+class _PersistentProcReader:
+    """
+    Read the /proc files behind get_system_stats through long-lived fds.
+
+    The files are opened once and re-read from offset 0 each cycle into
+    pre-allocated buffers, so a cycle costs one pread per file instead of an
+    open/read/close per psutil call.
+    """
+
+    PATHS = ('/proc/stat', '/proc/meminfo', '/proc/net/dev', '/proc/loadavg')
+    # Large enough for /proc/net/dev on hosts with many interfaces
+    BUFFER_SIZE = 16384
+
+    def __init__(self):
+        self._fds = []
+        for path in self.PATHS:
+            try:
+                self._fds.append(os.open(path, os.O_RDONLY))
+            except OSError:
+                self.close()
+                raise
+        self._bufs = [bytearray(self.BUFFER_SIZE) for _ in self.PATHS]
+        self._views = [memoryview(buf) for buf in self._bufs]
+
+    def _prime(self):
+        """
+        Take the first CPU sample; each collect() measures from the previous one.
+
+        The reader is closed if this first read fails.
+        """
+        try:
+            self._prev_cpu = _parse_proc_stat(self._read_all()[0])
+        except Exception:
+            self.close()
+            raise
+
+    def _read_all(self) -> List[bytes]:
+        """Re-read every file from the start into its buffer."""
+        results = []
+        for index, fd in enumerate(self._fds):
+            buf = self._bufs[index]
+            n = os.preadv(fd, [buf], 0)
+            if n == len(buf):
+                # Buffer filled up, so the file may be truncated; grow it for good
+                data = _pread_grow(fd, len(buf))
+                self._bufs[index] = bytearray(2 * len(data))
+                self._views[index] = memoryview(self._bufs[index])
+            else:
+                data = bytes(self._views[index][:n])
+            results.append(data)
+        return results
+
+    def collect(self) -> Dict:
+        """
+        Read and parse all /proc sources.
+
+        Returns:
+            Dict: Raw CPU, memory, network and load figures
+        """
+        stat, meminfo, net_dev, loadavg = self._read_all()
+
+        total, idle = _parse_proc_stat(stat)
+        prev_total, prev_idle = self._prev_cpu
+        self._prev_cpu = (total, idle)
+        delta = total - prev_total
+        cpu_percent = round((delta - (idle - prev_idle)) / delta * 100, 1) if delta else 0.0
+
+        raw = {
+            'cpu_percent': cpu_percent,
+            'load_avg': float(loadavg.split()[0]),
+        }
+        raw.update(_parse_proc_meminfo(meminfo))
+        raw.update(_parse_proc_net_dev(net_dev))
+        return raw
+
+    def close(self):
+        """Close the /proc file descriptors."""
+        for fd in self._fds:
+            os.close(fd)
+        self._fds = []
+
+
+class _UringCollector(_PersistentProcReader):
+    """
+    Read the /proc files behind get_system_stats in one io_uring batch.
+
+    The persistent fds and buffers are registered with the ring, so each
+    cycle costs a single io_uring_enter instead of one read per file.
+
+    With sqpoll enabled a kernel thread polls the submission queue, so
+    submitting a batch no longer needs a syscall while the thread is awake.
+    The thread idles after the kernel default of one second, so this only
+    pays off at sub-second check intervals. Its busy-polling is counted in
+    /proc/stat, so the monitor reports its own polling as CPU load: up to
+    about 100/N % on an N-CPU host, enough to trip the CPU alert on small
+    machines.
+    """
+
+    def __init__(self, sqpoll: bool = False):
+        super().__init__()
+        self._ring = liburing.Ring()
+        self._cqe = liburing.Cqe()
+        try:
+            flags = liburing.IORING_SETUP_SQPOLL if sqpoll else 0
+            liburing.io_uring_queue_init(8, self._ring, flags)
+            # Keep references alive for as long as they are registered
+            self._iov = liburing.Iovec(self._bufs)
+            self._files = liburing.FileIndex(self._fds)
+            liburing.io_uring_register_buffers(self._ring, self._iov)
+            liburing.io_uring_register_files(self._ring, self._files)
+        except Exception:
+            self.close()
+            raise
+
+    def _read_all(self) -> List[bytes]:
+        """Submit one fixed read per file and wait for all completions."""
+        ring = self._ring
+        for index, buf in enumerate(self._bufs):
+            sqe = liburing.io_uring_get_sqe(ring)
+            liburing.io_uring_prep_read_fixed(sqe, index, buf, index, 0)
+            liburing.io_uring_sqe_set_flags(sqe, liburing.IOSQE_FIXED_FILE)
+            sqe.user_data = index
+
+        results = [b''] * len(self._bufs)
+        liburing.io_uring_submit_and_wait(ring, len(self._bufs))
+        pending = len(self._bufs)
+        while pending:
+            liburing.io_uring_wait_cqe(ring, self._cqe)
+            ready = liburing.io_uring_cq_ready(ring)
+            for i in range(ready):
+                cqe = self._cqe[i]
+                if cqe.res < 0:
+                    raise OSError(-cqe.res, os.strerror(-cqe.res),
+                                  self.PATHS[cqe.user_data])
+                index = cqe.user_data
+                if cqe.res == len(self._bufs[index]):
+                    # Registered buffers can't be resized, so re-read this
+                    # file outside the ring rather than parse a truncated copy
+                    results[index] = _pread_grow(self._fds[index], cqe.res)
+                else:
+                    results[index] = bytes(self._views[index][:cqe.res])
+            liburing.io_uring_cq_advance(ring, ready)
+            pending -= ready
+        return results
+
+    def close(self):
+        """Tear down the ring and close the /proc file descriptors."""
+        if self._ring is not None:
+            try:
+                liburing.io_uring_queue_exit(self._ring)
+            except Exception:
+                pass
+            self._ring = None
+        super().close()
+
+
 class SystemMonitor:
     """
     A comprehensive system health monitoring tool.
@@ -31,23 +337,64 @@ class SystemMonitor:
     - JSON output support
     """
     
-    def __init__(self, config_file: str = 'config.yaml'):
+    def __init__(self, config_file: str = 'config.yaml', fast: bool = False,
+                 quiet: bool = False):
         """
         Initialize the system monitor with configuration.
         
         Args:
             config_file (str): Path to the configuration file
+            fast (bool): Enable io_uring SQPOLL regardless of the config
+            quiet (bool): Skip console output and rely on the log file
         """
         self.config_file = config_file
+        self.quiet = quiet
         self.config = self._load_config()
         self._setup_logging()
         self.alert_sent = False  # Prevent spam emails
+        self._email_enabled = self.config['email']['enabled']
+        self._proc_reader = self._init_proc_reader(
+            fast or (self.config.get('uring') or {}).get('sqpoll', False)
+        )
+        
+        # Figures that do not change for the life of the process
+        self._cpu_count_logical = psutil.cpu_count()
+        self._cpu_count_physical = psutil.cpu_count(logical=False)
+        self._boot_time = int(psutil.boot_time())
+        self._boot_time_str = _fast_ts(self._boot_time)
+        self._mem_total = psutil.virtual_memory().total
+        self._mem_total_gb = round(self._mem_total / _GB, 2)
+        self._disk_total = shutil.disk_usage('/').total
+        self._disk_total_gb = round(self._disk_total / _GB, 2)
+        
+        # Prime psutil's CPU counters so cpu_percent() never has to block.
+        # The first collection waits until _MIN_CPU_WINDOW has passed since
+        # priming so its reading is meaningful, see _collect_raw().
+        psutil.cpu_percent(interval=None)
+        self._cpu_primed_at = time.monotonic()
+        
+        thresholds = self.config['thresholds']
+        self._cpu_th = thresholds['cpu']
+        self._mem_th = thresholds['memory']
+        self._disk_th = thresholds['disk']
+        
+        # (stat key, label, threshold %, threshold x10, display section for "GB used")
+        self._threshold_checks = (
+            ('cpu_pct_x10', 'CPU', self._cpu_th, self._cpu_th * 10, None),
+            ('mem_pct_x10', 'Memory', self._mem_th, self._mem_th * 10, 'memory'),
+            ('disk_pct_x10', 'Disk', self._disk_th, self._disk_th * 10, 'disk'),
+        )
+        
+        # Persistent pool so the independent psutil probes can run side by side
+        self._pool = concurrent.futures.ThreadPoolExecutor(
+            max_workers=4, thread_name_prefix='monstat'
+        )
         
     def _load_config(self) -> Dict:
         """Load configuration from YAML file."""
         try:
             with open(self.config_file, 'r') as file:
-                config = yaml.safe_load(file)
+                config = yaml.load(file, Loader=_YamlLoader)
                 return config
         except FileNotFoundError:
             print(f"Config file {self.config_file} not found. Using default settings.")
@@ -77,6 +424,9 @@ class SystemMonitor:
             'logging': {
                 'level': 'INFO',
                 'file': 'system_monitor.log'
+            },
+            'uring': {
+                'sqpoll': False
             }
         }
     # logging in...
@@ -93,124 +443,196 @@ class SystemMonitor:
         )
         self.logger = logging.getLogger(__name__)
     
+    def _init_proc_reader(self, sqpoll: bool = False) -> Optional[_PersistentProcReader]:
+        """
+        Set up the fastest available /proc reader.
+        
+        Prefers io_uring, then plain persistent fds, and returns None (use
+        psutil) on systems without /proc.
+        """
+        # An explicitly requested SQPOLL that can't be honoured is worth a warning
+        log_uring_failure = self.logger.warning if sqpoll else self.logger.debug
+        if liburing is not None:
+            try:
+                reader = _UringCollector(sqpoll)
+                reader._prime()
+                if sqpoll:
+                    self.logger.warning(
+                        "io_uring SQPOLL enabled: the kernel polling thread busy-waits "
+                        "after each cycle and its CPU time is included in the reported "
+                        "CPU usage"
+                    )
+                return reader
+            except Exception as e:
+                log_uring_failure(f"io_uring unavailable, using plain /proc reads: {e}")
+        elif sqpoll:
+            log_uring_failure("io_uring SQPOLL requested but liburing is not installed")
+        
+        try:
+            reader = _PersistentProcReader()
+            reader._prime()
+            return reader
+        except Exception as e:
+            self.logger.debug(f"/proc unavailable, falling back to psutil: {e}")
+            return None
+
+    def _collect_psutil(self) -> Dict:
+        """
+        Collect raw CPU, memory, network and load figures via psutil.
+
+        Returns:
+            Dict: Same layout as _UringCollector.collect()
+        """
+        pool = self._pool
+        f_cpu = pool.submit(psutil.cpu_percent, None)
+        f_mem = pool.submit(psutil.virtual_memory)
+        f_net = pool.submit(psutil.net_io_counters)
+        f_load = pool.submit(_load_avg)
+
+        memory = f_mem.result()
+        network = f_net.result()
+
+        return {
+            'cpu_percent': f_cpu.result(),
+            'mem_total': memory.total,
+            'mem_used': memory.used,
+            'mem_available': memory.available,
+            'mem_percent': memory.percent,
+            'bytes_sent': network.bytes_sent,
+            'bytes_recv': network.bytes_recv,
+            'packets_sent': network.packets_sent,
+            'packets_recv': network.packets_recv,
+            'load_avg': f_load.result(),
+        }
+
+    def _collect_raw(self) -> Dict:
+        """Collect raw figures through the /proc reader when available, else psutil."""
+        if self._cpu_primed_at is not None:
+            # Like cpu_percent(interval=1), the first sample needs a real window
+            remaining = _MIN_CPU_WINDOW - (time.monotonic() - self._cpu_primed_at)
+            if remaining > 0:
+                time.sleep(remaining)
+            self._cpu_primed_at = None
+        
+        if self._proc_reader is not None:
+            try:
+                return self._proc_reader.collect()
+            except Exception as e:
+                self.logger.warning(f"/proc collection failed, falling back to psutil: {e}")
+                self._proc_reader.close()
+                self._proc_reader = None
+        return self._collect_psutil()
+
     def get_system_stats(self) -> Dict:
         """
         Collect comprehensive system statistics.
         
+        Values are kept as raw integers (bytes, epoch seconds, percentages
+        scaled by 10); use _format_for_display() for the human-readable form.
+        
         Returns:
-            Dict: System statistics including CPU, memory, disk, and network
+            Dict: Flat system statistics including CPU, memory, disk, and network
         """
         try:
-            # CPU Information
-            cpu_percent = psutil.cpu_percent(interval=1)
-            cpu_count_logical = psutil.cpu_count()
-            cpu_count_physical = psutil.cpu_count(logical=False)
-            
-            # Memory Information
-            memory = psutil.virtual_memory()
-            memory_percent = memory.percent
-            memory_total_gb = round(memory.total / (1024**3), 2)
-            memory_used_gb = round(memory.used / (1024**3), 2)
-            memory_available_gb = round(memory.available / (1024**3), 2)
-            
-            # Disk Information
-            disk = psutil.disk_usage('/')
-            disk_percent = round((disk.used / disk.total) * 100, 2)
-            disk_total_gb = round(disk.total / (1024**3), 2)
-            disk_used_gb = round(disk.used / (1024**3), 2)
-            disk_free_gb = round(disk.free / (1024**3), 2)
-            
-            # Load Average (Unix-like systems)
-            try:
-                load_avg = psutil.getloadavg()[0] if hasattr(psutil, 'getloadavg') else 0
-            except (OSError, AttributeError):
-                load_avg = 0
+            # Disk usage is a statvfs call, so run it alongside the /proc reads
+            f_disk = self._pool.submit(shutil.disk_usage, '/')
+            raw = self._collect_raw()
+            disk = f_disk.result()
             
-            # Network Information
-            network = psutil.net_io_counters()
-            
-            # System Uptime
-            boot_time = datetime.fromtimestamp(psutil.boot_time())
-            uptime = datetime.now() - boot_time
-            
-            # Process Count
-            process_count = len(psutil.pids())
-            
-            stats = {
-                'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-                'cpu': {
-                    'percent': cpu_percent,
-                    'count_logical': cpu_count_logical,
-                    'count_physical': cpu_count_physical,
-                    'load_avg': round(load_avg, 2)
-                },
-                'memory': {
-                    'percent': memory_percent,
-                    'total_gb': memory_total_gb,
-                    'used_gb': memory_used_gb,
-                    'available_gb': memory_available_gb
-                },
-                'disk': {
-                    'percent': disk_percent,
-                    'total_gb': disk_total_gb,
-                    'used_gb': disk_used_gb,
-                    'free_gb': disk_free_gb
-                },
-                'network': {
-                    'bytes_sent': network.bytes_sent,
-                    'bytes_recv': network.bytes_recv,
-                    'packets_sent': network.packets_sent,
-                    'packets_recv': network.packets_recv
-                },
-                'system': {
-                    'uptime_days': uptime.days,
-                    'uptime_hours': uptime.seconds // 3600,
-                    'process_count': process_count,
-                    'boot_time': boot_time.strftime('%Y-%m-%d %H:%M:%S')
-                }
+            return {
+                'ts_epoch': int(time.time()),
+                'cpu_pct_x10': int(round(raw['cpu_percent'] * 10)),
+                'load_avg_x100': int(round(raw['load_avg'] * 100)),
+                'mem_pct_x10': int(round(raw['mem_percent'] * 10)),
+                'mem_used': raw['mem_used'],
+                'mem_available': raw['mem_available'],
+                'mem_total': self._mem_total,
+                # Rounded half up, not truncated, so e.g. 90.05% still exceeds 90
+                'disk_pct_x10': (disk.used * 2000 + self._disk_total) // (2 * self._disk_total),
+                'disk_used': disk.used,
+                'disk_free': disk.free,
+                'disk_total': self._disk_total,
+                'net_sent': raw['bytes_sent'],
+                'net_recv': raw['bytes_recv'],
+                'net_packets_sent': raw['packets_sent'],
+                'net_packets_recv': raw['packets_recv'],
+                'process_count': _count_pids(),
             }
             
-            return stats
-            
         except Exception as e:
             self.logger.error(f"Error collecting system stats: {e}")
             return {}
     
+    def _format_for_display(self, stats: Dict) -> Dict:
+        """
+        Convert raw statistics into the nested, human-readable layout.
+        
+        Args:
+            stats (Dict): Raw statistics from get_system_stats()
+            
+        Returns:
+            Dict: Statistics with GB figures, percentages and formatted times
+        """
+        uptime = stats['ts_epoch'] - self._boot_time
+        
+        return {
+            'timestamp': _fast_ts(stats['ts_epoch']),
+            'cpu': {
+                'percent': stats['cpu_pct_x10'] / 10,
+                'count_logical': self._cpu_count_logical,
+                'count_physical': self._cpu_count_physical,
+                'load_avg': stats['load_avg_x100'] / 100
+            },
+            'memory': {
+                'percent': stats['mem_pct_x10'] / 10,
+                'total_gb': self._mem_total_gb,
+                'used_gb': round(stats['mem_used'] / _GB, 2),
+                'available_gb': round(stats['mem_available'] / _GB, 2)
+            },
+            'disk': {
+                'percent': round((stats['disk_used'] / stats['disk_total']) * 100, 2),
+                'total_gb': self._disk_total_gb,
+                'used_gb': round(stats['disk_used'] / _GB, 2),
+                'free_gb': round(stats['disk_free'] / _GB, 2)
+            },
+            'network': {
+                'bytes_sent': stats['net_sent'],
+                'bytes_recv': stats['net_recv'],
+                'packets_sent': stats['net_packets_sent'],
+                'packets_recv': stats['net_packets_recv']
+            },
+            'system': {
+                'uptime_days': uptime // 86400,
+                'uptime_hours': uptime % 86400 // 3600,
+                'process_count': stats['process_count'],
+                'boot_time': self._boot_time_str
+            }
+        }
+    
+    def _exceeded_checks(self, stats: Dict) -> List[tuple]:
+        """Return the _threshold_checks entries whose metric is over its threshold."""
+        return [check for check in self._threshold_checks if stats[check[0]] > check[3]]
+    
     def check_thresholds(self, stats: Dict) -> List[str]:
         """
         Check if any metrics exceed configured thresholds.
         
         Args:
-            stats (Dict): System statistics
+            stats (Dict): Raw system statistics
             
         Returns:
             List[str]: List of alert messages
         """
         alerts = []
-        thresholds = self.config['thresholds']
-        
-        # Check CPU threshold
-        if stats['cpu']['percent'] > thresholds['cpu']:
-            alerts.append(
-                f"CPU usage: {stats['cpu']['percent']:.1f}% "
-                f"(threshold: {thresholds['cpu']}%)"
-            )
-        
-        # Check Memory threshold
-        if stats['memory']['percent'] > thresholds['memory']:
-            alerts.append(
-                f"Memory usage: {stats['memory']['percent']:.1f}% "
-                f"(threshold: {thresholds['memory']}%) - "
-                f"{stats['memory']['used_gb']:.1f}GB used"
-            )
-        
-        # Check Disk threshold
-        if stats['disk']['percent'] > thresholds['disk']:
-            alerts.append(
-                f"Disk usage: {stats['disk']['percent']:.1f}% "
-                f"(threshold: {thresholds['disk']}%) - "
-                f"{stats['disk']['used_gb']:.1f}GB used"
-            )
+        view = None
+        for key, name, threshold, limit_x10, section in self._exceeded_checks(stats):
+            message = f"{name} usage: {stats[key] / 10:.1f}% (threshold: {threshold}%)"
+            if section:
+                # Same rounded figure the console and email show
+                if view is None:
+                    view = self._format_for_display(stats)
+                message += f" - {view[section]['used_gb']:.1f}GB used"
+            alerts.append(message)
         
         return alerts
     
@@ -220,9 +642,9 @@ class SystemMonitor:
         
         Args:
             alerts (List[str]): List of alert messages
-            stats (Dict): Current system statistics
+            stats (Dict): Current raw system statistics
         """
-        if not alerts or not self.config['email']['enabled']:
+        if not alerts or not self._email_enabled:
             return
         
         # Prevent spam - only send one alert per monitoring session
@@ -231,47 +653,31 @@ class SystemMonitor:
         
         try:
             smtp_config = self.config['email']
+            view = self._format_for_display(stats)
             
-            msg = MIMEMultipart()
+            msg = EmailMessage()
             msg['From'] = smtp_config['from']
             msg['To'] = smtp_config['to']
-            msg['Subject'] = f"System Health Alert - {datetime.now().strftime('%Y-%m-%d %H:%M')}"
+            msg['Subject'] = f"System Health Alert - {view['timestamp'][:16]}"
             
             # Create detailed email body
-            body = f"""
-System Health Alert - Threshold Exceeded
-
-Time: {stats['timestamp']}
-System Uptime: {stats['system']['uptime_days']} days, {stats['system']['uptime_hours']} hours
-
-ALERTS:
-"""
-            for alert in alerts:
-                body += f"  • {alert}\n"
+            system = view['system']
+            parts = [_ALERT_HEADER.format(
+                timestamp=view['timestamp'],
+                uptime_days=system['uptime_days'],
+                uptime_hours=system['uptime_hours']
+            )]
+            parts.extend(f"  • {alert}" for alert in alerts)
+            parts.append(_ALERT_FOOTER.format(**view))
+            body = "\n".join(parts)
             
-            body += f"""
-
-CURRENT SYSTEM STATUS:
-  CPU Usage: {stats['cpu']['percent']:.1f}% (Load: {stats['cpu']['load_avg']})
-  Memory Usage: {stats['memory']['percent']:.1f}% ({stats['memory']['used_gb']:.1f}GB / {stats['memory']['total_gb']:.1f}GB)
-  Disk Usage: {stats['disk']['percent']:.1f}% ({stats['disk']['used_gb']:.1f}GB / {stats['disk']['total_gb']:.1f}GB)
-  Active Processes: {stats['system']['process_count']}
-
-Please investigate and take necessary action.
-
----
-System Health Monitor
-Generated automatically
-"""
-            
-            msg.attach(MIMEText(body, 'plain'))
+            msg.set_content(body)
             
             # Send email
-            server = smtplib.SMTP(smtp_config['smtp_server'], smtp_config['port'])
-            server.starttls()
-            server.login(smtp_config['username'], smtp_config['password'])
-            server.send_message(msg)
-            server.quit()
+            with smtplib.SMTP(smtp_config['smtp_server'], smtp_config['port']) as server:
+                server.starttls()
+                server.login(smtp_config['username'], smtp_config['password'])
+                server.send_message(msg)
             
             self.logger.info("Alert email sent successfully")
             self.alert_sent = True
@@ -283,62 +689,80 @@ Generated automatically
         """
         Display formatted system statistics to console.
         
+        The block is written with a single stdout write; nothing is shown
+        in quiet mode.
+        
         Args:
-            stats (Dict): System statistics
+            stats (Dict): Raw system statistics
             alerts (List[str]): Current alerts
         """
-        print(f"\n{'='*60}")
-        print(f"🖥️  SYSTEM HEALTH MONITOR - {stats['timestamp']}")
-        print(f"{'='*60}")
+        if self.quiet:
+            return
+        
+        view = self._format_for_display(stats)
+        exceeded = {check[0] for check in self._exceeded_checks(stats)}
+        
+        lines = [
+            f"\n{'='*60}",
+            f"🖥️  SYSTEM HEALTH MONITOR - {view['timestamp']}",
+            f"{'='*60}",
+        ]
         
         # CPU Information
-        cpu_status = "RED" if stats['cpu']['percent'] > self.config['thresholds']['cpu'] else "🟢"
-        print(f"{cpu_status} CPU Usage: {stats['cpu']['percent']:.1f}% "
-              f"(Load: {stats['cpu']['load_avg']}) "
-              f"[{stats['cpu']['count_physical']} cores, {stats['cpu']['count_logical']} threads]")
+        cpu_status = "RED" if 'cpu_pct_x10' in exceeded else "🟢"
+        lines.append(f"{cpu_status} CPU Usage: {view['cpu']['percent']:.1f}% "
+                     f"(Load: {view['cpu']['load_avg']}) "
+                     f"[{view['cpu']['count_physical']} cores, {view['cpu']['count_logical']} threads]")
         
         # Memory Information
-        memory_status = "RED" if stats['memory']['percent'] > self.config['thresholds']['memory'] else "🟢"
-        print(f"{memory_status} Memory Usage: {stats['memory']['percent']:.1f}% "
-              f"({stats['memory']['used_gb']:.1f}GB / {stats['memory']['total_gb']:.1f}GB)")
+        memory_status = "RED" if 'mem_pct_x10' in exceeded else "🟢"
+        lines.append(f"{memory_status} Memory Usage: {view['memory']['percent']:.1f}% "
+                     f"({view['memory']['used_gb']:.1f}GB / {view['memory']['total_gb']:.1f}GB)")
         
         # Disk Information
-        disk_status = "RED" if stats['disk']['percent'] > self.config['thresholds']['disk'] else "🟢"
-        print(f"{disk_status} Disk Usage: {stats['disk']['percent']:.1f}% "
-              f"({stats['disk']['used_gb']:.1f}GB / {stats['disk']['total_gb']:.1f}GB)")
+        disk_status = "RED" if 'disk_pct_x10' in exceeded else "🟢"
+        lines.append(f"{disk_status} Disk Usage: {view['disk']['percent']:.1f}% "
+                     f"({view['disk']['used_gb']:.1f}GB / {view['disk']['total_gb']:.1f}GB)")
         
         # System Information
-        print(f"Uptime: {stats['system']['uptime_days']} days, {stats['system']['uptime_hours']} hours")
-        print(f"Active Processes: {stats['system']['process_count']}")
+        lines.append(f"Uptime: {view['system']['uptime_days']} days, {view['system']['uptime_hours']} hours")
+        lines.append(f"Active Processes: {view['system']['process_count']}")
         
         # Network Information
-        print(f"Network: ⬆{stats['network']['bytes_sent']:,} bytes sent, "
-              f"⬇{stats['network']['bytes_recv']:,} bytes received")
+        lines.append(f"Network: ⬆{view['network']['bytes_sent']:,} bytes sent, "
+                     f"⬇{view['network']['bytes_recv']:,} bytes received")
         
         # Alerts
         if alerts:
-            print(f"\n  ACTIVE ALERTS ({len(alerts)}):")
-            for alert in alerts:
-                print(f"   {alert}")
+            lines.append(f"\n  ACTIVE ALERTS ({len(alerts)}):")
+            lines.extend(f"   {alert}" for alert in alerts)
         else:
-            print(f"\n All systems normal - no alerts")
+            lines.append(f"\n All systems normal - no alerts")
         
-        print(f"{'='*60}")
+        lines.append(f"{'='*60}")
+        sys.stdout.write("\n".join(lines) + "\n")
     
     def save_stats_json(self, stats: Dict, filename: str = None):
         """
-        Save statistics to JSON file.
+        Save statistics to JSON file in the human-readable layout.
         
         Args:
-            stats (Dict): System statistics
+            stats (Dict): Raw system statistics
             filename (str): Output filename (optional)
         """
         if not filename:
-            filename = f"system_stats_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+            # Same second as the stats themselves, so name and contents agree
+            ts_epoch = stats.get('ts_epoch', int(time.time()))
+            filename = f"system_stats_{time.strftime('%Y%m%d_%H%M%S', time.localtime(ts_epoch))}.json"
         
         try:
-            with open(filename, 'w') as f:
-                json.dump(stats, f, indent=2)
+            view = self._format_for_display(stats)
+            if orjson is not None:
+                with open(filename, 'wb') as f:
+                    f.write(orjson.dumps(view, option=orjson.OPT_INDENT_2))
+            else:
+                with open(filename, 'w') as f:
+                    json.dump(view, f, indent=2)
             self.logger.info(f"Statistics saved to {filename}")
         except Exception as e:
             self.logger.error(f"Failed to save statistics: {e}")
@@ -354,22 +778,40 @@ Generated automatically
         if not stats:
             return {}
         
-        alerts = self.check_thresholds(stats)
+        warn = self.logger.isEnabledFor(logging.WARNING)
+        
+        # Alerts are only worth building if something will show or send them
+        if self._email_enabled or warn or not self.quiet:
+            alerts = self.check_thresholds(stats)
+        else:
+            alerts = []
         self.display_stats(stats, alerts)
         
         if alerts:
-            self.logger.warning(f"System alerts triggered: {len(alerts)} threshold(s) exceeded")
-            self.send_alert(alerts, stats)
+            if warn:
+                self.logger.warning(f"System alerts triggered: {len(alerts)} threshold(s) exceeded")
+            if self._email_enabled:
+                self.send_alert(alerts, stats)
         
         return stats
     
+    def close(self):
+        """Release the worker pool and the /proc file descriptors."""
+        self._pool.shutdown(wait=False)
+        if self._proc_reader is not None:
+            self._proc_reader.close()
+            self._proc_reader = None
+    
     def run_monitoring(self):
         """Main continuous monitoring loop."""
         self.logger.info("Starting system health monitoring...")
         self.logger.info(f"Monitoring interval: {self.config['check_interval']} seconds")
-        self.logger.info(f"Thresholds - CPU: {self.config['thresholds']['cpu']}%, "
-                        f"Memory: {self.config['thresholds']['memory']}%, "
-                        f"Disk: {self.config['thresholds']['disk']}%")
+        self.logger.info(f"Thresholds - CPU: {self._cpu_th}%, "
+                        f"Memory: {self._mem_th}%, "
+                        f"Disk: {self._disk_th}%")
+        
+        interval = self.config['check_interval']
+        next_tick = time.monotonic()
         
         try:
             while True:
@@ -378,12 +820,21 @@ Generated automatically
                 if stats:
                     # Log basic stats
                     self.logger.info(
-                        f"CPU: {stats['cpu']['percent']:.1f}% | "
-                        f"Memory: {stats['memory']['percent']:.1f}% | "
-                        f"Disk: {stats['disk']['percent']:.1f}%"
+                        f"CPU: {stats['cpu_pct_x10'] / 10:.1f}% | "
+                        f"Memory: {stats['mem_pct_x10'] / 10:.1f}% | "
+                        f"Disk: {stats['disk_pct_x10'] / 10:.1f}%"
                     )
                 
-                time.sleep(self.config['check_interval'])
+                # Sleep until the next deadline so collection time doesn't add drift
+                next_tick += interval
+                delay = next_tick - time.monotonic()
+                if delay > 0:
+                    time.sleep(delay)
+                else:
+                    self.logger.warning(
+                        f"Monitoring cycle overran the {interval}s interval by {-delay:.2f}s"
+                    )
+                    next_tick = time.monotonic()
                 
         except KeyboardInterrupt:
             self.logger.info("Monitoring stopped by user.")
@@ -404,6 +855,8 @@ Examples:
   python monitor.py -c custom.yaml     # Use custom config
   python monitor.py --once             # Run once and exit
   python monitor.py --json output.json # Save stats to JSON
+  python monitor.py --fast             # io_uring SQPOLL for short intervals (adds CPU load)
+  python monitor.py --quiet            # No console stats, log file only
         """
     )
     
@@ -424,6 +877,20 @@ Examples:
         help='Save statistics to JSON file'
     )
     
+    parser.add_argument(
+        '--fast',
+        action='store_true',
+        help='Enable io_uring SQPOLL polling for sub-second check intervals; '
+             'the polling thread counts towards reported CPU usage '
+             '(up to 100/N%% on an N-CPU host)'
+    )
+    
+    parser.add_argument(
+        '--quiet',
+        action='store_true',
+        help='Do not print statistics to the console (log file only)'
+    )
+    
     parser.add_argument(
         '--version',
         action='version',
@@ -432,8 +899,9 @@ Examples:
     
     args = parser.parse_args()
     
+    monitor = None
     try:
-        monitor = SystemMonitor(args.config)
+        monitor = SystemMonitor(args.config, fast=args.fast, quiet=args.quiet)
         
         if args.once:
             # Run once and exit
@@ -449,6 +917,9 @@ Examples:
     except Exception as e:
         print(f"\n Error: {e}")
         return 1
+    finally:
+        if monitor is not None:
+            monitor.close()
     
     return 0
 